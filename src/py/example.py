@@ -1,3 +1,6 @@
-from solitaireSort import solitaireSort
+import random
+import solitaireSortRules
+from solitaireSort import solitaire_sort, CARD_FACES
 
-solitaireSort([])
+cards = [random.choice(CARD_FACES) for _ in range(52)]
+print(solitaire_sort(cards, solitaireSortRules))
@@ -10,38 +10,78 @@ remark: This project is explicitly a joke and not meant for production.
 """
 
 
-from typing import Literal, Callable, TypeAlias
+from typing import Literal, TypeAlias, Iterable, Iterator, Sequence
 from warnings import warn
-import re, traceback, math, random
+from collections import deque
+from array import array
+from itertools import chain
+import re, math, random, functools, logging
 import solitaireSortRules as rules
 
 
+logger = logging.getLogger(__name__)
+
+
+# The rules are constants, so they're read once here instead of through the `rules` module on every use.
+_HAND_SIZE_MAX: int = rules.HAND_SIZE_MAX
+_HAND_ALLOW_RANDOM_ACCESS: bool = rules.HAND_ALLOW_RANDOM_ACCESS
+
+
+@functools.lru_cache(maxsize=16)
+def _indent_re(spaces: int) -> re.Pattern:
+    """The compiled pattern matching `spaces` leading whitespace characters on each line."""
+    return re.compile(f'^\\s{{{spaces}}}', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=128)
 def clean_lambda(lambda_string: str) -> str:
-    """A helper for removing the leading indent of a lambda function."""
+    """A helper for removing the leading indent of a lambda function.
+    Memoized, since the same few lambda sources get cleaned over and over.
+    """
     last_line_index = lambda_string.rfind('\n')
     if last_line_index == -1:
         return lambda_string
     last_line: str = lambda_string[last_line_index:]
     spaces_in_last_line: int = last_line.find('}') - 1
-    rx = f'^\\s{{{spaces_in_last_line}}}'
-    return re.sub(pattern=rx, repl='', string=lambda_string, flags=re._FlagsType.MULTILINE)
+    return _indent_re(spaces_in_last_line).sub('', lambda_string)
+
 
+CARD_FACES: str = "A234567890JQK"
+"""The printable face of each `Card`, indexed by its rank.
+(uses 0 instead of 10)
+"""
 
-Card: TypeAlias[str] = str
+
+Card: TypeAlias = int
 """An abstraction for a unit of data used in the algorithm.
 
 ---
 
-Currently implemented as a string of
-```js
-/^[A2-90JQK]$/
+Currently implemented as an integer rank in the range
+```py
+range(len(CARD_FACES)) # [0..13)
 ```
-(uses 0 instead of 10)
+See `parse_card` and `format_card` for converting to and from the printable face.
 """
 
 
+_RANK_OF_FACE: dict[str, Card] = {face: rank for rank, face in enumerate(CARD_FACES)}
+"""Lookup table from printable face to `Card`, built once at import."""
+
+
 def is_card(x) -> bool:
-    return re.match(r'^[A2-90JQK]$', x) is not None
+    """Whether `x` is a printable card face (`/^[A2-90JQK]$/`)."""
+    return isinstance(x, str) and x in _RANK_OF_FACE
+
+
+def parse_card(face: str) -> Card:
+    """Converts a printable face (`/^[A2-90JQK]$/`) into a `Card`."""
+    return _RANK_OF_FACE[face]
+
+
+def format_card(card: Card) -> str:
+    """Converts a `Card` into its printable face."""
+    return CARD_FACES[card]
 
 
 def compare_card(a: Card, b: Card) -> int:
@@ -50,8 +90,7 @@ def compare_card(a: Card, b: Card) -> int:
     Returns:
         number: Difference between a and b.
     """
-    def numify(x: Card) -> int: return "A234567890JQK".find(x)
-    return numify(b) - numify(a)
+    return b - a
 
 
 def stackable(a: Card, b: Card) -> bool:
@@ -64,7 +103,25 @@ def stackable(a: Card, b: Card) -> bool:
     Returns:
         bool: Whether `b` is exactly 1 more than `a`
     """
-    return compare_card(a, b) == 1
+    return b - a == 1
+
+
+def _count_moveable(cards: Sequence[Card], n: int, face_up: int) -> int:
+    """Counts the consecutively incrementing run ending at `cards[n - 1]`, at most `face_up` long.
+
+    Kept as a free function over the stack's raw `array('b')` buffer so the scan has no attribute lookups or calls.
+    """
+    if face_up == 0:
+        return 0
+
+    above: Card = cards[n - 1]
+    for i in range(1, face_up):
+        below: Card = cards[n - 1 - i]
+        if above - below != 1:
+            return i
+        above = below # Carried over so each step only indexes once
+
+    return face_up
 
 
 class FieldStack:
@@ -74,19 +131,27 @@ class FieldStack:
         A stack.
     """
 
-    def __init__(self, cards: list[Card] = [], face_up: int = 0):
-        self._cards = cards
-        """The list of cards in the stack.
+    __slots__ = ('_cards', '_len', 'face_up', '_moveable')
+
+    def __init__(self, cards: list[Card] | None = None, face_up: int = 0):
+        self._cards: array = array('b', () if cards is None else cards) # Own copy, since its tail ends up holding stale cards
+        """The packed (signed byte) buffer of cards in the stack. Only the first `_len` are in play; the rest are stale and get overwritten.
         The back (last element) is called the top, while the front (first element) is called the bottom.
         """
+        self._len: int = len(self._cards)
+        """The number of cards in play in `_cards`. Pulling only moves this cursor, so the buffer never shrinks."""
         self.face_up: int = face_up
         """The number of cards considered public, counts starting from the top (the back/last element)"""
         assert(self.face_up <= self.num_cards)
+        self._moveable: int | None = None
+        """Cached result of `get_moveable`, or `None` if it needs recounting.
+        Every method that changes the stack updates it in place when that's cheap, and clears it otherwise.
+        """
 
 
     def get_num_cards(self) -> int:
         """Tells how many **total** cards are in the stack - both `face_up` and `face_down`."""
-        return len(self._cards)
+        return self._len
 
 
     num_cards = property(get_num_cards)
@@ -95,7 +160,7 @@ class FieldStack:
 
     def get_face_down(self) -> int:
         """Tells how many `face_down` cards are in the stack - only cards that are not `face_up`."""
-        return self.num_cards() - self.face_up
+        return self._len - self.face_up
 
 
     face_down = property(get_face_down)
@@ -104,7 +169,7 @@ class FieldStack:
 
     def get_face_up_cards(self) -> list[Card]:
         """A readable copy of the `face_up` cards from the top of the stack."""
-        return self._cards[-self.face_up:]
+        return self._cards[self._len - self.face_up:self._len].tolist()
 
 
     face_up_cards = property(get_face_up_cards)
@@ -113,13 +178,9 @@ class FieldStack:
 
     def get_moveable(self) -> int:
         """The number of moveable cards in the stack. Cards are moveable if they consecutively increment."""
-        for i in range(1, self.face_up):
-            card_prev: Card = self._cards[self.get_num_cards() - (i - 1)]
-            card_curr: Card = self._cards[self.get_num_cards() - i]
-            if not stackable(card_prev, card_curr):
-                return i
-
-        return self.face_up
+        if self._moveable is None:
+            self._moveable = _count_moveable(self._cards, self._len, self.face_up)
+        return self._moveable
 
 
     moveable = property(get_moveable)
@@ -129,7 +190,7 @@ class FieldStack:
     def get_moveable_cards(self) -> list[Card]:
         """A readable copy of the moveable cards from the top of the stack.
         """
-        return self._cards[-self.moveable:]
+        return self._cards[self._len - self.moveable:self._len].tolist()
 
 
     moveable_cards = property(get_moveable_cards)
@@ -144,12 +205,13 @@ class FieldStack:
             False: The requested card is face down.
             None: There are no cards.
         """
-        if self.num_cards == 0:
+        n = self._len
+        if n == 0:
             return None
         elif self.face_up == 0:
             return False
         else:
-            return self._cards[self.num_cards - 1]
+            return self._cards[n - 1]
 
 
     top_card = property(get_top_card)
@@ -162,24 +224,70 @@ class FieldStack:
     """
 
 
+    def get_top_run(self) -> tuple[Card, int] | None:
+        """The top card and `moveable` together, or `None` if there's no face-up top card."""
+        if self.face_up == 0: # Also covers an empty stack
+            return None
+        return (self._cards[self._len - 1], self.get_moveable())
+
+
+    top_run = property(get_top_run)
+    """The top card and `moveable` together, or `None` if there's no face-up top card."""
+
+
+    def push_card(self, card: Card) -> None:
+        """Places a single `card` on top of the stack. The new card will be `face_up`.
+
+        Existing `face_up` cards on top of the stack will *remain* `face_up`.
+        """
+        n = self._len
+        moveable = self._moveable
+        if moveable is not None:
+            # Either continues the run on top or starts a new one
+            self._moveable = moveable + 1 if moveable > 0 and card - self._cards[n - 1] == 1 else 1
+        if n < len(self._cards):
+            self._cards[n] = card
+        else:
+            self._cards.append(card)
+        self._len += 1
+        self.face_up += 1
+
+
+    def push_cards(self, cards: list[Card]) -> None:
+        """Places `cards` on top of the stack, in order. The new cards will be `face_up`.
+
+        Existing `face_up` cards on top of the stack will *remain* `face_up`.
+        """
+        if len(cards) == 0:
+            warn("Tried to push 0 cards. Was this intentional?")
+            return
+        n = self._len
+        k = len(cards)
+        self._cards[n:n + k] = array('b', cards) # Overwrites stale cards, growing the buffer only if needed
+        self._len += k
+        self.face_up += k
+        moveable = self._moveable
+        if moveable is not None:
+            # Only the new cards need scanning; if they're one unbroken run, it may continue the old run on top
+            run = _count_moveable(self._cards, self._len, k)
+            if run == k and moveable > 0 and cards[0] - self._cards[n - 1] == 1:
+                run += moveable
+            self._moveable = run
+
+
     def push_to_top(self, cards: Card | list[Card]) -> None:
         """Places `cards` on top of the stack. The new cards will be `face_up`.
+        Dispatches to `push_cards` or `push_card`; prefer calling those directly when the type is known.
 
         Existing `face_up` cards on top of the stack will *remain* `face_up`.
         """
-
-        if cards is list:
-            if len(cards) == 0:
-                warn("Tried to push 0 cards. Was this intentional?")
-                return
-            self._cards.extend(cards)
-            self.face_up += len(cards)
+        if isinstance(cards, (list, tuple, array)):
+            self.push_cards(cards)
         else:
-            self._cards.append(cards)
-            self.face_up += 1
+            self.push_card(cards)
 
 
-    def pull_from_top(self, n: int | None) -> Card | list[Card]:
+    def pull_from_top(self, n: int | None = None) -> Card | list[Card]:
         """Removes the requested (visible) cards from the stack and returns them.
         Don't use this for non-visible cards.
 
@@ -187,18 +295,24 @@ class FieldStack:
             n: The number of cards to pull from the top. If `undefined`, returns the top card singularly instead of as an array.
         """
         if n == None:
-            assert self.num_cards >= 1
-            return self._cards.pop()
+            assert self._len >= 1
+            assert self.face_up >= 1
+            self._shorten_moveable(1)
+            self.face_up -= 1
+            self._len -= 1
+            return self._cards[self._len]
 
         if n == 0:
             warn("Tried to pull 0 cards. Was this intentional?")
             return []
 
-        assert n <= self.num_cards
+        assert n <= self._len
         assert n <= self.face_up
 
-        result = self._cards[-n:]
-        self._cards = self._cards[:-n]
+        self._shorten_moveable(n)
+        self._len -= n
+        result = self._cards[self._len:self._len + n].tolist()
+        self.face_up -= n
 
         return result
 
@@ -206,6 +320,8 @@ class FieldStack:
     def reveal(self, n: int) -> None:
         """Makes `n`-more cards `face_up`."""
         assert n <= self.face_down
+        if self._moveable == self.face_up: # The run reached the face down cards, so it may continue into them
+            self._moveable = None
         self.face_up += n
 
 
@@ -213,6 +329,16 @@ class FieldStack:
         """Makes `n`-fewer cards `face_up`."""
         assert n <= self.face_up
         self.face_up -= n
+        if self._moveable is not None:
+            self._moveable = min(self._moveable, self.face_up)
+
+
+    def _shorten_moveable(self, n: int) -> None:
+        """Updates the cached `moveable` for `n` cards being pulled from the top.
+        What's left of the run is still the whole run, but if none of it is left, the cards below need counting.
+        """
+        if self._moveable is not None:
+            self._moveable = self._moveable - n if self._moveable > n else None
 
 
 class FoundationStack:
@@ -233,9 +359,9 @@ class FoundationStack:
         An append-only stack.
     """
 
-    def __init__(self, cards: list[Card] = []):
-        self._cards: list[Card] = cards,
-        """The list of cards in the stack.
+    def __init__(self, cards: list[Card] | None = None):
+        self._cards: array = array('b', () if cards is None else cards)
+        """The packed (signed byte) array of cards in the stack.
         The back (last element) is called the top, while the front (first element) is called the bottom.
         """
 
@@ -250,8 +376,9 @@ class FoundationStack:
 
     def get_top_card(self) -> Card:
         """A readable copy of the visible card on top of the stack."""
-        assert self.num_cards != 0
-        return self._cards[self.num_cards - 1]
+        n = len(self._cards)
+        assert n != 0
+        return self._cards[n - 1]
 
 
     top_card = property(get_top_card)
@@ -260,7 +387,7 @@ class FoundationStack:
 
     def get_all_cards(self) -> list[Card]:
         """A readable copy of the stack's cards."""
-        return self._cards.copy()
+        return self._cards.tolist()
 
 
     all_cards = property(get_all_cards)
@@ -279,14 +406,24 @@ class FoundationStack:
         Exceptions:
             "Out of order" error: `cards` is not increasing in value or is of lesser value than top_card.
         """
-        if cards is list:
-            if len(cards) == 0:
-                warn("Tried to push 0 cards. Was this intentional?")
-                return None
-
-            self._cards.extend(cards)
+        if isinstance(cards, (list, tuple, array)):
+            self.push_cards(cards)
         else:
-            self._cards.append(cards)
+            self.push_card(cards)
+
+
+    def push_card(self, card: Card) -> None:
+        """Places a single `card` on top of the stack. See `push_to_top`."""
+        self._cards.append(card)
+
+
+    def push_cards(self, cards: list[Card]) -> None:
+        """Places `cards` on top of the stack, in order. See `push_to_top`."""
+        if len(cards) == 0:
+            warn("Tried to push 0 cards. Was this intentional?")
+            return None
+
+        self._cards.extend(cards)
 
 
 class Deck:
@@ -297,9 +434,9 @@ class Deck:
     Summary:
         A queue.
     """
-    def __init__(self, cards = []):
-        self._cards: list[Card] = cards
-        """The list of cards in the stack.
+    def __init__(self, cards: list[Card] | None = None):
+        self._cards: deque[Card] = deque() if cards is None else deque(cards)
+        """The queue of cards in the deck.
         The back (last element) is called the top, while the front (first element) is called the bottom.
         """
 
@@ -318,8 +455,7 @@ class Deck:
         Parameters:
             cards: The cards to push to the front of the queue.
         """
-        cards.extend(self._cards)
-        self._cards = cards
+        self._cards.extendleft(reversed(cards))
 
 
     def pull_from_top(self, n: int) -> list[Card]:
@@ -331,17 +467,34 @@ class Deck:
         Parameters:
             n: The number of cards to pull from the back of the queue.
         """
-        assert n <= self.num_cards
-        result = self._cards[-n:]
-        self._cards = self._cards[:-n]
+        assert n <= len(self._cards)
+        pop = self._cards.pop
+        result = [pop() for _ in range(n)]
+        result.reverse() # Keep the bottom-to-top order of the pulled cards
         return result
 
 
+    def pull_from_top_into(self, out: array, n: int) -> None:
+        """## Only {@linkcode Hand} is intended use this.
+        Same as `pull_from_top`, but appends the cards straight onto `out` instead of returning a new list.
+
+        Parameters:
+            out: The packed (signed byte) array to append to.
+            n: The number of cards to pull from the back of the queue.
+        """
+        assert n <= len(self._cards)
+        pop = self._cards.pop
+        start = len(out)
+        out.frombytes(bytes(n)) # Reserve the slots, then fill them top-down to keep bottom-to-top order
+        for i in range(start + n - 1, start - 1, -1):
+            out[i] = pop()
+
+
     def shuffle(self) -> None:
         """Randomizes the order of the elements."""
-        for i in reversed(range(self.num_cards)):
-            j = random.randint(0, i)
-            self._cards[i], self._cards[j] = (self._cards[j], self._cards[i]) # Swaps elements i and j
+        cards = list(self._cards) # Shuffling a deque in place is slow; its random access is not O(1)
+        random.shuffle(cards)
+        self._cards = deque(cards)
 
 
 class Hand:
@@ -355,23 +508,23 @@ class Hand:
         A fixed-capacity vector.
     """
 
-    def __init__(self, cards: list[Card] = []):
-        self._cards: list[Card] = cards
-        """The list of cards in the stack.
+    def __init__(self, cards: list[Card] | None = None):
+        self._cards: array = array('b', () if cards is None else cards)
+        """The packed (signed byte) array of cards in the hand.
         The back (last element) is called the top, while the front (first element) is called the bottom.
         """
-        assert len(cards) <= rules.HAND_SIZE_MAX
+        assert len(self._cards) <= _HAND_SIZE_MAX
 
     def get_cards_in_hand(self) -> list[Card]:
         """A readable copy of the cards in the hand."""
-        return self._cards[:]
+        return self._cards.tolist()
 
     cards_in_hand = property(get_cards_in_hand)
     """A readable copy of the cards in the hand."""
 
     def get_top_card(self) -> Card:
         """A readable copy of the card at the back of the list."""
-        return self._cards[self.get_num_cards - 1]
+        return self._cards[len(self._cards) - 1]
 
 
     @staticmethod
@@ -382,7 +535,7 @@ class Hand:
             HAND_ALLOW_RANDOM_ACCESS
             pull_at
         """
-        return rules.HAND_ALLOW_RANDOM_ACCESS
+        return _HAND_ALLOW_RANDOM_ACCESS
     
 
     is_random_access = property(get_is_random_access)
@@ -401,7 +554,7 @@ class Hand:
         See:
             HAND_SIZE_MAX
         """
-        return rules.HAND_SIZE_MAX
+        return _HAND_SIZE_MAX
     
 
     max_cards = property(get_max_cards)
@@ -428,13 +581,13 @@ class Hand:
         @param index The zero-based index of the card to pull.
         """
 
-        if not rules.HAND_ALLOW_RANDOM_ACCESS:
-            print("Random Hand access is currently disallowed by the HAND_ALLOW_RANDOM_ACCESS rule.")
-            traceback.print_exc()
+        if not _HAND_ALLOW_RANDOM_ACCESS:
+            warn("Random Hand access is currently disallowed by the HAND_ALLOW_RANDOM_ACCESS rule.")
             return False
 
-        assert self.get_num_cards > 0
-        assert index < self.get_num_cards
+        n = len(self._cards)
+        assert n > 0
+        assert index < n
 
         return self._cards.pop(index)
 
@@ -445,7 +598,7 @@ class Hand:
         Returns:
             The card at the top.
         """
-        assert self.get_num_cards > 0
+        assert len(self._cards) > 0
         return self._cards.pop()
 
 
@@ -456,8 +609,10 @@ class Hand:
     the entire remaining deck will be emptied into the hand.
     """
     def draw(self, deck: Deck) -> None:
-        deck.push_to_bottom(self._cards)
-        self._cards = deck.pull_from_top(min(rules.HAND_SIZE_MAX, deck.num_cards))
+        if self._cards: # Nothing to pass back on the first draw
+            deck.push_to_bottom(self._cards)
+            del self._cards[:]
+        deck.pull_from_top_into(self._cards, min(_HAND_SIZE_MAX, deck.num_cards))
 
 
 class Game:
@@ -496,7 +651,7 @@ class Game:
         Each stack in the field gets one more card than the previous, and the first gets 1.
         """
         for i in range(len(self.field)):
-            self.field[i].push_to_top(self.deck.pull_from_top(i + 1))
+            self.field[i].push_cards(self.deck.pull_from_top(i + 1))
 
 
     def setup(self) -> None:
@@ -506,42 +661,49 @@ class Game:
         3. Deals cards to hand
         """
         self.deck.shuffle()
-        self.deal_to_field()
+        self._deal_to_field()
         self.hand.draw(self.deck)
 
 
     def visualize(self) -> None:
-        """Prints a snapshot of the game to the console."""
+        """Logs a snapshot of the game at DEBUG level. Does nothing unless DEBUG logging is enabled."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        # The whole snapshot is built up and logged in one call rather than one call per line
+        lines: list[str] = []
         indent = 0
 
         def group(str):
-            print(str)
+            nonlocal indent
+            lines.append('  '*indent+str)
             indent += 1
 
         def group_end():
+            nonlocal indent
             assert indent > 0
             indent -= 1
 
         group("snapshot")
 
         if self.deck.num_cards > 0:
-            print('  '*indent+f'deck: {self.deck.num_cards} cards')
+            lines.append('  '*indent+f'deck: {self.deck.num_cards} cards')
         else:
-            print('  '*indent+'deck: empty')
+            lines.append('  '*indent+'deck: empty')
 
 
         if self.hand.num_cards > 0:
-            print('  '*indent+f'hand: {self.hand.num_cards} (out of {Hand.max_cards} max) cards: [[{"][".join(self.hand.cards_in_hand)}]]')
+            lines.append('  '*indent+f'hand: {self.hand.num_cards} (out of {Hand.get_max_cards()} max) cards: [[{"][".join(map(format_card, self.hand.cards_in_hand))}]]')
         else:
-            print('  '*indent+f'hand: empty ({Hand.max_cards} max)')
+            lines.append('  '*indent+f'hand: empty ({Hand.get_max_cards()} max)')
 
 
         group("field")
         for i in range(len(self.field)):
             if self.field[i].num_cards > 0:
-                print('  '*indent+f'{i}: {self.field[i].num_cards} cards: [{"[?]"*self.field[i].face_down}[{"][".join(self.field[i].face_up_cards)}]]')
+                lines.append('  '*indent+f'{i}: {self.field[i].num_cards} cards: [{"[?]"*self.field[i].face_down}[{"][".join(map(format_card, self.field[i].face_up_cards))}]]')
             else:
-                print('  '*indent+f'{i}: empty')
+                lines.append('  '*indent+f'{i}: empty')
 
 
         group_end()
@@ -549,28 +711,59 @@ class Game:
         group("foundation")
         for i in range(len(self.foundation)):
             if self.foundation[i].num_cards > 0:
-                print('  '*indent+f'{i}: {self.foundation[i].num_cards} cards: top: [{self.foundation[i].top_card}]')
+                lines.append('  '*indent+f'{i}: {self.foundation[i].num_cards} cards: top: [{format_card(self.foundation[i].top_card)}]')
             else:
-                print('  '*indent+f'{i}: empty')
+                lines.append('  '*indent+f'{i}: empty')
 
         group_end()
 
         group_end()
 
+        logger.debug('\n'.join(lines))
+
 
-class GameAction:
-    """A performable move in the game.
-    Call exec to perform the move.
+def _field_moves(stacks: list[tuple[int, Card, int]]) -> Iterator[tuple[int, int, int]]:
+    """Lazily yields every legal move between field stacks as `(src, count, dest)`, in search order.
+
+    Parameters:
+        stacks: `(index, top card, moveable)` for each field stack with a face-up top.
+
+    Moves come out by source stack, then destination stack, both in field order.
+    Nothing is searched past what the caller takes, so taking the first move stops at the first legal one.
     """
+    for src_index, run_top, moveable in stacks:
+        # The moveable run increments by exactly 1, so at most one of its cards
+        # can go on any given top: the one exactly 1 above it.
+        # Everything above that card moves with it.
+        # (`src` as its own `dest` always gives a count of 0, so it needs no separate check)
+        for dest_index, dest_top, _ in stacks:
+            count = run_top - dest_top
+            if 0 < count <= moveable:
+                yield (src_index, count, dest_index)
+
+
+GameAction: TypeAlias = tuple[int, int, int, int]
+"""A performable move in the game, as `(score, src, count, dest)`.
+Call `apply_move` to perform the move.
+
+- score: Value of playing this move.
+- src: Index of the field stack to move from, or `FROM_HAND`.
+- count: Number of cards to move from the top of `src`.
+- dest: Index of the field stack to move onto.
+"""
+
 
-    score: int
-    """Value of playing this move."""
+FROM_HAND: int = -1
+"""`GameAction` source meaning the top card of the hand rather than a field stack."""
 
-    exec: Callable[[None], None]
-    """Perform the action."""
 
-    debug: str
-    """"""
+def apply_move(game: 'Game', action: GameAction) -> None:
+    """Performs the move described by `action`. Its score is ignored."""
+    _, src, count, dest = action
+    if src == FROM_HAND:
+        game.field[dest].push_card(game.hand.pull())
+    else:
+        game.field[dest].push_cards(game.field[src].pull_from_top(count))
 
 
 class GameStatus:
@@ -591,46 +784,50 @@ class Gamer:
         """Personal reference to the game so we don't have to constantly pass it around."""
     
 
-    def _get_move_options(self) -> list[GameAction]:
-        """Returns a list of the possible moves in the gamestate.
-        If the result is an empty array, no moves are possible and the game should end.
+    def _get_best_move(self) -> GameAction | None:
+        """Returns the highest scoring possible move in the gamestate, without collecting every option.
+        If the result is `None`, no moves are possible and the game should end.
+        Ties go to the first move found.
         """
-        options: list[GameAction] = []
-
-        if (Hand.is_random_access):
-            self._game.hand.cards_in_hand
-        else:
-            self._game.hand.top_card
-
-        for src in self._game.field:
-            moveable_cards = src.moveable_cards
-            moveable = len(moveable_cards)
-            for dest in self._game.field:
-                if src == dest:
-                    continue
-
-                dest_top = dest.top_card
-                if not dest_top:
-                    continue
-
-                for num in range(moveable):
-                    if stackable(dest_top, moveable_cards[num]):
-                        options.append({
-                            'score': 1,
-                            'exec': lambda: dest.push_to_top(src.pull_from_top(num + 1)),
-                            'debug': f'Move ',
-                        })
-                        break
+        best: GameAction | None = None
+        best_score: int = -1
+        log_options: bool = logger.isEnabledFor(logging.DEBUG)
+
+        # Todo: Consider moves from the hand - all of `cards_in_hand` if `Hand.is_random_access`, otherwise just its `top_card`.
+
+        # Gather everything the search needs from the field in a single pass, so the search itself is plain int math.
+        # Empty and face-down stacks can neither be moved from nor onto, so they are left out entirely.
+        # A stack with a face-up top always has at least that one card moveable.
+        stacks: list[tuple[int, Card, int]] = [] # (index, top card, moveable)
+        for i, stack in enumerate(self._game.field):
+            top_run = stack.top_run
+            if top_run is not None:
+                stacks.append((i, *top_run))
+
+        field_moves: Iterable[tuple[int, int, int]] = _field_moves(stacks)
+        if log_options:
+            field_moves = list(field_moves)
+            for src_index, count, dest_index in field_moves:
+                logger.debug("move option: %s", (1, src_index, count, dest_index))
+
+        # Every field move scores the same, so the first one found is the best of them
+        # and the search can stop there.
+        first_field_move = next(iter(field_moves), None)
+        if first_field_move is not None:
+            best_score = 1
+            best = (best_score, *first_field_move)
 
         # Debug
         if self._game.hand.num_cards != 0:
-            options.append({
-                'score': 999,
-                'exec': lambda:
-                    # Transfers top card from hand into first column of the field
-                    self._game.field[0].push_to_top(self._game.hand.pull())
-            })
-        return options
+            # Transfers top card from hand into first column of the field
+            score = 999
+            if log_options:
+                logger.debug("move option: %s", (score, FROM_HAND, 1, 0))
+            if score > best_score:
+                best_score = score
+                best = (score, FROM_HAND, 1, 0)
+
+        return best
 
     def try_make_move(self) -> GameStatus:
         """Selects and performs a move in the game.
@@ -639,26 +836,16 @@ class Gamer:
             Success. If false, no moves are possible and game should end.
         """
 
-        options: list[GameAction] = self._get_move_options()
+        highest_scored_option: GameAction | None = self._get_best_move()
 
-        if len(options) == 0:
+        if highest_scored_option is None:
             # Todo: Add "win" condition
             # Todo: Make sure infinite loops are caught and treated as losses.
             return GameStatus.LOSS
-        
-        highest_scored_option = options[0]
-        for opt in options:
-            if opt.score > highest_scored_option.score:
-                highest_scored_option = opt
 
-        # Not sure how to do this in Python
-        # print("move options")
-        # for opt in options:
-        #     print(clean_lambda(opt.exec))
-        
-        # print(f'Selected move: {clean_lambda(highest_scored_option.exec)}')
+        logger.debug("Selected move: %s", highest_scored_option)
 
-        highest_scored_option.exec()
+        apply_move(self._game, highest_scored_option)
 
         return GameStatus.PLAYING
 
@@ -676,38 +863,43 @@ def play(data: list[Card]) -> list[Card] | Literal[False]:
     game.setup()
     gamer: Gamer = Gamer(game)
 
+    # Checked once up front so turns don't even call `visualize` when snapshots aren't being logged
+    show_snapshots: bool = logger.isEnabledFor(logging.DEBUG)
+
     while True:
 
         # Display the game state before each move
-        game.visualize()
+        if show_snapshots:
+            game.visualize()
 
         game_status = gamer.try_make_move()
 
         if game_status == GameStatus.LOSS:
-            print("Lost")
+            logger.info("Lost")
             return False
         elif game_status == GameStatus.PLAYING:
             break
         elif game_status == GameStatus.WIN:
-            stacks: list[list[Card]] = map(lambda stack: stack.all_cards, game.foundation)
-            return [element for sublist in stacks for element in sublist] # This is so weird looking
+            return list(chain.from_iterable(stack.all_cards for stack in game.foundation))
         else:
             raise "What?"
 
 
-def solitaire_sort(data: list[Card], rules) -> list[Card]:
+def solitaire_sort(data: list[str], rules) -> list[str]:
     """Sorts the data by playing a game of faux-solitaire.
 
     Parameters:
-        data: The list of cards to be sorted.
+        data: The list of card faces to be sorted.
 
     Todo:
         Pass in rules as object instead of using constants
     """
+    # Converted in bulk through the lookup tables themselves, skipping a Python call per card
+    cards: list[Card] = list(map(_RANK_OF_FACE.__getitem__, data))
     max_tries: int = 3
     for _ in range(max_tries):
-        sorted: list[Card] | Literal[False] = play(data.copy())
+        sorted: list[Card] | Literal[False] = play(cards.copy())
         if sorted != False:
-            return sorted or data
+            return list(map(CARD_FACES.__getitem__, sorted or cards))
     
     raise f'Lost {max_tries} times. Not retrying.'